@@ -1,19 +1,57 @@
 #!/usr/bin/env python3
 import argparse
+import bisect
+import functools
 import json
 import os
-import csv
+import re
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 import time as _time
 import signal
 
-DEFAULT_DATA_FILE = os.path.expanduser("~/.timelog.json")
+try:
+    # Optional speedup (pip install "tt-time[fast]"); stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_DATA_FILE = os.path.expanduser("~/.timelog.jsonl")
+# v1 format: a single pretty-printed JSON array, migrated on first use
+LEGACY_DATA_FILE = os.path.expanduser("~/.timelog.json")
 ENV_DATA_FILE = "TT_TIME_FILE"
 
+# signal number -> name, built once rather than inside the signal handler.
+# SIG_* are handler/mask constants (SIG_IGN, SIG_UNBLOCK...) whose values
+# collide with real signal numbers, so they are left out.
+SIGNAL_NAMES: Dict[int, str] = {
+    getattr(signal, n): n
+    for n in dir(signal)
+    if n.startswith("SIG") and not n.startswith("SIG_") and isinstance(getattr(signal, n, None), int)
+}
+
+
+if orjson is not None:
+    # Both backends raise ValueError subclasses on bad input (JSONDecodeError, and
+    # UnicodeDecodeError from the stdlib on invalid UTF-8), so callers catch ValueError
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+else:
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
 
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
 def data_file_path() -> str:
+    # Resolved once per process; the env and home dir don't change mid-run
     # 1) Explicit env override wins
     env = os.environ.get(ENV_DATA_FILE)
     if env:
@@ -22,86 +60,187 @@ def data_file_path() -> str:
     return DEFAULT_DATA_FILE
 
 
+def _migrate_legacy(path: str) -> None:
+    # One-shot conversion of the v1 JSON array into JSONL (one entry per line).
+    # Covers both ~/.timelog.json -> ~/.timelog.jsonl and a TT_TIME_FILE that
+    # still holds an array (converted in place).
+    source = path
+    if not os.path.exists(path):
+        if path != DEFAULT_DATA_FILE or not os.path.exists(LEGACY_DATA_FILE):
+            return
+        source = LEGACY_DATA_FILE
+    with open(source, "rb") as f:
+        if f.read(64).lstrip()[:1] != b"[":
+            return
+        f.seek(0)
+        try:
+            data = _json_loads(f.read())
+        except ValueError:
+            data = None
+    if data is None:
+        # Corrupt file fallback
+        try:
+            os.replace(source, source + ".bak")
+        except Exception:
+            pass
+        return
+    save_data(data)
+    if source != path:
+        # Keep the old file around, but out of the way of future migrations
+        os.replace(source, source + ".bak")
+
+
 def load_data() -> List[Dict]:
     path = data_file_path()
+    _migrate_legacy(path)
+    data: List[Dict] = []
     if os.path.exists(path):
-        try:
-            with open(path, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            # Corrupt file fallback
-            backup = path + ".bak"
-            try:
-                os.replace(path, backup)
-            except Exception:
-                pass
-            return []
-    return []
+        with open(path, "rb") as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    data.append(_json_loads(line))
+                except ValueError:
+                    # Skip a corrupt/partial line rather than losing the whole log.
+                    # ValueError covers both bad JSON and invalid UTF-8 (e.g. a
+                    # multi-byte character cut off by an interrupted write).
+                    print(f"Warning: skipping unreadable line {lineno} in {path}", file=sys.stderr)
+                    continue
+    return data
 
 
 essential_keys = {"project", "start", "end"}
+_ESSENTIAL_ORDER = ("project", "start", "end")
+
+
+def _clean_entry(e: Dict) -> Dict:
+    # Entries written by this program already lead with project/start/end; reuse as-is
+    if tuple(e)[:3] == _ESSENTIAL_ORDER:
+        return e
+    # prune unexpected fields lightly and ensure order; dicts keep insertion
+    # order, so extra keys are simply re-inserted after the essential ones
+    cleaned = {"project": e.get("project"), "start": e.get("start"), "end": e.get("end")}
+    for k, v in e.items():
+        if k not in essential_keys:
+            cleaned[k] = v
+    return cleaned
+
+
+def _entry_line(e: Dict) -> bytes:
+    return _json_dumps(_clean_entry(e)) + b"\n"
 
 
 def save_data(data: List[Dict]) -> None:
+    # Full rewrite; start/stop/log use the append/tail helpers below instead
     path = data_file_path()
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    # prune unexpected fields lightly and ensure order
-    cleaned: List[Dict] = []
-    for e in data:
-        cleaned.append({
-            "project": e.get("project"),
-            "start": e.get("start"),
-            "end": e.get("end"),
-            **{k: v for k, v in e.items() if k not in essential_keys},
-        })
     tmp = path + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(cleaned, f, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(b"".join(_entry_line(e) for e in data))
     os.replace(tmp, path)
 
 
+def append_entry(entry: Dict) -> Tuple[int, int]:
+    # O(1) regardless of log size: a single appended line.
+    # Returns the (start, end) byte offsets of that line.
+    path = data_file_path()
+    _migrate_legacy(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a+b") as f:
+        offset = f.seek(0, os.SEEK_END)
+        if offset:
+            # A hand-edited/synced file or an interrupted write may lack the final
+            # newline; without one the new entry would be glued onto that line
+            f.seek(offset - 1)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+                offset += 1
+        f.write(_entry_line(entry))
+        return offset, f.tell()
+
+
+def _last_line_offset(f) -> int:
+    # Scan backwards in 4KB chunks for the newline that precedes the last line
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    tail = b""
+    while pos > 0:
+        step = min(4096, pos)
+        pos -= step
+        f.seek(pos)
+        tail = f.read(step) + tail
+        idx = tail.rstrip(b"\r\n").rfind(b"\n")
+        if idx != -1:
+            return pos + idx + 1
+    return 0
+
+
+def load_last_entry() -> Optional[Dict]:
+    path = data_file_path()
+    _migrate_legacy(path)
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        f.seek(_last_line_offset(f))
+        line = f.read().strip()
+    if not line:
+        return None
+    try:
+        return _json_loads(line)
+    except ValueError:
+        return None
+
+
+def _rewrite_tail(f, offset: int, entry: Dict) -> None:
+    f.seek(offset)
+    f.truncate()
+    f.write(_entry_line(entry))
+
+
+def update_last_entry(entry: Dict) -> None:
+    # Rewrite only the final line in place (used to close the active entry)
+    path = data_file_path()
+    with open(path, "r+b") as f:
+        _rewrite_tail(f, _last_line_offset(f), entry)
+
+
+def update_appended_entry(span: Tuple[int, int], entry: Dict) -> bool:
+    # Rewrite a line previously written by append_entry() at its known offset,
+    # as long as it is still the untouched tail of the file. Anything else
+    # (a stop from another shell, a later append) changes the file size.
+    path = data_file_path()
+    try:
+        with open(path, "r+b") as f:
+            if f.seek(0, os.SEEK_END) != span[1]:
+                return False
+            _rewrite_tail(f, span[0], entry)
+            return True
+    except OSError:
+        return False
+
+
+# "1h30m", "1hr30min", "2h", "45min" ... one scan in the C regex engine
+_DUR_RE = re.compile(r"(\d+)(hr|h|min|m)")
+_HHMM_RE = re.compile(r"(\d+):([0-5]?\d)")
+
+
 def parse_duration(s: str) -> timedelta:
     s = s.strip().lower()
-    total = 0
-    num = ""
-    had_unit = False
-    i = 0
-    
-    while i < len(s):
-        ch = s[i]
-        if ch.isdigit():
-            num += ch
-        elif ch == "h":
-            if not num:
-                raise ValueError("Missing number before 'h'")
-            total += int(num) * 60
-            num = ""
-            had_unit = True
-            # Check if next characters are "r" (for "hr")
-            if i + 1 < len(s) and s[i + 1] == "r":
-                i += 1  # Skip the "r"
-        elif ch == "m":
-            if not num:
-                raise ValueError("Missing number before 'm'")
-            total += int(num)
-            num = ""
-            had_unit = True
-            # Check if next characters are "in" (for "min")
-            if i + 2 < len(s) and s[i + 1:i + 3] == "in":
-                i += 2  # Skip "in"
-        elif ch in (":",):
-            # Support HH:MM format
-            pass
-        elif ch in ("r", "i", "n"):
-            # Skip these as they're part of "hr" or "min"
-            pass
-        else:
-            raise ValueError(f"Unsupported character in duration: {ch}")
-        i += 1
-    
-    if num and not had_unit:
+    if s.isdigit():
         # plain minutes (e.g., "90")
-        total += int(num)
+        total = int(s)
+    elif ":" in s:
+        # HH:MM (e.g., "1:30"); minutes must be 0-59
+        hhmm = _HHMM_RE.fullmatch(s)
+        if not hhmm:
+            raise ValueError(f"Unsupported duration format: {s!r}")
+        total = int(hhmm.group(1)) * 60 + int(hhmm.group(2))
+    else:
+        parts = _DUR_RE.findall(s)
+        if not parts or _DUR_RE.sub("", s):
+            raise ValueError(f"Unsupported duration format: {s!r}")
+        total = sum(int(n) * (60 if unit in ("h", "hr") else 1) for n, unit in parts)
     if total <= 0:
         raise ValueError("Duration must be > 0")
     return timedelta(minutes=total)
@@ -125,125 +264,195 @@ def _osc8_link(text: str, url: str) -> str:
     return f"\x1b]8;;{url}\x1b\\{text}\x1b]8;;\x1b\\"
 
 
+# Large ASCII digital clock (HH:MM:SS) using light shading (░) instead of solid blocks
+DIGITS: Dict[str, List[str]] = {
+    '0': [
+        " ░░░ ",
+        "░   ░",
+        "░   ░",
+        "░   ░",
+        " ░░░ ",
+    ],
+    '1': [
+        "  ░  ",
+        " ░░  ",
+        "  ░  ",
+        "  ░  ",
+        " ░░░ ",
+    ],
+    '2': [
+        " ░░░ ",
+        "    ░",
+        " ░░░ ",
+        "░    ",
+        "░░░░░",
+    ],
+    '3': [
+        "░░░░ ",
+        "    ░",
+        " ░░░ ",
+        "    ░",
+        "░░░░ ",
+    ],
+    '4': [
+        "░  ░ ",
+        "░  ░ ",
+        "░░░░░",
+        "   ░ ",
+        "   ░ ",
+    ],
+    '5': [
+        "░░░░░",
+        "░    ",
+        "░░░░ ",
+        "    ░",
+        "░░░░ ",
+    ],
+    '6': [
+        " ░░░ ",
+        "░    ",
+        "░░░░ ",
+        "░   ░",
+        " ░░░ ",
+    ],
+    '7': [
+        "░░░░░",
+        "   ░ ",
+        "  ░  ",
+        " ░   ",
+        " ░   ",
+    ],
+    '8': [
+        " ░░░ ",
+        "░   ░",
+        " ░░░ ",
+        "░   ░",
+        " ░░░ ",
+    ],
+    '9': [
+        " ░░░ ",
+        "░   ░",
+        " ░░░░",
+        "    ░",
+        " ░░░ ",
+    ],
+    ':': [
+        "     ",
+        "  ░  ",
+        "     ",
+        "  ░  ",
+        "     ",
+    ],
+}
+
+# Per-character glyph rows with the inter-digit gap already appended, so a frame
+# row is a single join instead of repeated concatenation
+GLYPH_ROWS: Dict[str, List[str]] = {ch: [row + "  " for row in glyph] for ch, glyph in DIGITS.items()}
+
+
 def _render_analog_clock_loop(start_dt: datetime, project_name: str) -> None:
-    # Large ASCII digital clock (HH:MM:SS) using light shading (░) instead of solid blocks
-    DIGITS = {
-        '0': [
-            " ░░░ ",
-            "░   ░",
-            "░   ░",
-            "░   ░",
-            " ░░░ ",
-        ],
-        '1': [
-            "  ░  ",
-            " ░░  ",
-            "  ░  ",
-            "  ░  ",
-            " ░░░ ",
-        ],
-        '2': [
-            " ░░░ ",
-            "    ░",
-            " ░░░ ",
-            "░    ",
-            "░░░░░",
-        ],
-        '3': [
-            "░░░░ ",
-            "    ░",
-            " ░░░ ",
-            "    ░",
-            "░░░░ ",
-        ],
-        '4': [
-            "░  ░ ",
-            "░  ░ ",
-            "░░░░░",
-            "   ░ ",
-            "   ░ ",
-        ],
-        '5': [
-            "░░░░░",
-            "░    ",
-            "░░░░ ",
-            "    ░",
-            "░░░░ ",
-        ],
-        '6': [
-            " ░░░ ",
-            "░    ",
-            "░░░░ ",
-            "░   ░",
-            " ░░░ ",
-        ],
-        '7': [
-            "░░░░░",
-            "   ░ ",
-            "  ░  ",
-            " ░   ",
-            " ░   ",
-        ],
-        '8': [
-            " ░░░ ",
-            "░   ░",
-            " ░░░ ",
-            "░   ░",
-            " ░░░ ",
-        ],
-        '9': [
-            " ░░░ ",
-            "░   ░",
-            " ░░░░",
-            "    ░",
-            " ░░░ ",
-        ],
-        ':': [
-            "     ",
-            "  ░  ",
-            "     ",
-            "  ░  ",
-            "     ",
-        ],
-    }
+    # A terminal resize can reflow or wipe the screen; repaint fully on the next tick
+    needs_repaint = False
+
+    def _on_resize(_signum, _frame):
+        nonlocal needs_repaint
+        needs_repaint = True
+
+    old_winch = None
+    if hasattr(signal, "SIGWINCH"):
+        old_winch = signal.signal(signal.SIGWINCH, _on_resize)
 
     # Enter alternate screen buffer and hide cursor to avoid scrollback spam
     print("\x1b[?1049h\x1b[?25l", end="")
     try:
+        prev: Optional[str] = None
+        # Anchor the wall clock once and advance it with the monotonic clock, so a
+        # tick is integer arithmetic instead of datetime.now() + strftime
+        anchor_wall = datetime.now()
+        anchor_mono = _time.monotonic()
+        day_ordinal: Optional[int] = None
+        day_label = ""
+        next_tick = anchor_mono + 1.0
         while True:
-            now = datetime.now()
-            elapsed = now - start_dt
-            hhmmss = now.strftime("%H:%M:%S")
-            # Build 5 rows
-            rows = [""] * 5
-            for ch in hhmmss:
-                glyph = DIGITS.get(ch, DIGITS['0'])
-                for i in range(5):
-                    rows[i] += glyph[i] + "  "
-
-            # Clear screen and move cursor to top-left
-            print("\x1b[2J\x1b[H", end="")
-            for r in rows:
-                print(r)
-
-            total = int(elapsed.total_seconds())
+            since = _time.monotonic() - anchor_mono
+            if since >= 60:
+                # Re-sync with the wall clock once a minute (NTP adjustments, suspend/resume)
+                anchor_wall = datetime.now()
+                anchor_mono = _time.monotonic()
+                since = 0.0
+                # ...and repaint everything, in case the screen was cleared or garbled
+                prev = None
+            if needs_repaint:
+                needs_repaint = False
+                prev = None
+            wall_secs = (anchor_wall.hour * 3600 + anchor_wall.minute * 60 + anchor_wall.second
+                         + anchor_wall.microsecond / 1_000_000 + since)
+            days, secs = divmod(int(wall_secs), 86400)
+            h, rem = divmod(secs, 3600)
+            m, s = divmod(rem, 60)
+            hhmmss = f"{h:02d}:{m:02d}:{s:02d}"
+            # The date part only changes at midnight
+            if anchor_wall.toordinal() + days != day_ordinal:
+                day_ordinal = anchor_wall.toordinal() + days
+                day_label = date.fromordinal(day_ordinal).isoformat()
+            out: List[str] = []
+            if prev is None:
+                # First frame (or repaint): clear screen, draw all glyph rows and the
+                # static project line, then save the cursor so the status lines below
+                # follow the project line even when a long name wraps
+                glyphs = [GLYPH_ROWS.get(ch, GLYPH_ROWS['0']) for ch in hhmmss]
+                out.append("\x1b[2J\x1b[H")
+                out.extend("".join(g[i] for g in glyphs) + "\n" for i in range(5))
+                # lowercase status lines
+                out.append(f"\ncurrently working on: {str(project_name).lower()}\n\x1b7")
+            else:
+                # Redraw only the glyph columns whose character changed (usually just seconds)
+                for idx, ch in enumerate(hhmmss):
+                    if ch == prev[idx]:
+                        continue
+                    glyph = GLYPH_ROWS.get(ch, GLYPH_ROWS['0'])
+                    col = idx * 7 + 1
+                    for i in range(5):
+                        out.append(f"\x1b[{i + 1};{col}H{glyph[i]}")
+            prev = hhmmss
+
+            total = int((anchor_wall - start_dt).total_seconds() + since)
             h, rem = divmod(total, 3600)
             m, s = divmod(rem, 60)
-            print("")
-            # lowercase status lines
-            print(f"currently working on: {str(project_name).lower()}")
-            print(now.strftime("time: %Y-%m-%d %H:%M:%S").lower())
-            print(f"elapsed: {h}h{m:02d}m{s:02d}s")
-            _time.sleep(1)
+            # time/elapsed lines change every tick; rewrite them in place (from the saved
+            # cursor position) and clear to end of line
+            out.append(f"\x1b8time: {day_label} {hhmmss}\x1b[K")
+            out.append(f"\r\nelapsed: {h}h{m:02d}m{s:02d}s\x1b[K\n")
+            print("".join(out), end="", flush=True)
+            # Sleep to the next tick deadline rather than a flat second so render time doesn't drift
+            mono = _time.monotonic()
+            if next_tick < mono:
+                # Fell behind (e.g. process was stopped); resume from now instead of catching up
+                next_tick = mono
+            _time.sleep(next_tick - mono)
+            next_tick += 1.0
     finally:
+        if old_winch is not None:
+            signal.signal(signal.SIGWINCH, old_winch)
         # Restore cursor and leave alternate screen buffer
         print("\x1b[?25h\x1b[?1049l", end="", flush=True)
 
 
+def _close_entry(entry: Dict, end_dt: datetime) -> None:
+    entry["end"] = end_dt.isoformat()
+    # compute duration_seconds
+    try:
+        start_dt = datetime.fromisoformat(entry["start"])
+        secs = int((end_dt - start_dt).total_seconds())
+        entry["duration_seconds"] = secs
+        entry["duration"] = _secs_to_hms(secs)
+    except Exception:
+        pass
+
+
 def cmd_start(args: argparse.Namespace) -> None:
-    data = load_data()
-    if data and data[-1].get("end") is None:
-        active = data[-1]
+    active = load_last_entry()
+    if active and active.get("end") is None:
         started = datetime.fromisoformat(active["start"]).strftime("%Y-%m-%d %H:%M")
         print(f"Already tracking '{active['project']}' since {started}. Use 'tt time stop' first.")
         return
@@ -251,28 +460,37 @@ def cmd_start(args: argparse.Namespace) -> None:
     # Support multi-word project names: args.project may be a list when nargs='+'
     project_name = " ".join(args.project) if isinstance(args.project, list) else args.project
     entry = {"project": project_name, "start": now_iso, "end": None}
-    data.append(entry)
-    save_data(data)
+    span = append_entry(entry)
     print(f"Started tracking: {project_name}")
     # Show clock by default unless user opts out
     if not getattr(args, "no_clock", False):
+        def _stop_started_entry(end_dt: datetime) -> Optional[Dict]:
+            # Close the entry appended above straight from memory, without
+            # re-reading the log; only if the file changed underneath us fall
+            # back to the tail read, and then only close the tail if it is still
+            # this process's entry (not one started later from another shell)
+            _close_entry(entry, end_dt)
+            if update_appended_entry(span, entry):
+                return entry
+            active = load_last_entry()
+            if (
+                active
+                and active.get("end") is None
+                and active.get("start") == entry["start"]
+                and active.get("project") == entry["project"]
+            ):
+                _close_entry(active, end_dt)
+                update_last_entry(active)
+                return active
+            return None
+
         # Install signal handlers to finalize on terminal/session close
         def _finalize_active_from_signal(signum, _frame):
             try:
-                end_dt = datetime.now()
-                data_sig = load_data()
-                if data_sig and data_sig[-1].get("end") is None:
-                    data_sig[-1]["end"] = end_dt.isoformat()
-                    try:
-                        start_dt = datetime.fromisoformat(data_sig[-1]["start"])
-                        secs = int((end_dt - start_dt).total_seconds())
-                        data_sig[-1]["duration_seconds"] = secs
-                        data_sig[-1]["duration"] = _secs_to_hms(secs)
-                    except Exception:
-                        pass
-                    save_data(data_sig)
-                    sig_name = {getattr(signal, n): n for n in dir(signal) if n.startswith("SIG")}.get(signum, str(signum))
-                    print(f"\nStopped (via {sig_name}):", data_sig[-1]["project"]) 
+                stopped = _stop_started_entry(datetime.now())
+                if stopped:
+                    sig_name = SIGNAL_NAMES.get(signum, str(signum))
+                    print(f"\nStopped (via {sig_name}):", stopped["project"]) 
             finally:
                 # Ensure terminal is restored (show cursor, leave alt screen)
                 try:
@@ -290,40 +508,20 @@ def cmd_start(args: argparse.Namespace) -> None:
             _render_analog_clock_loop(datetime.fromisoformat(now_iso), project_name)
         except KeyboardInterrupt:
             # On Ctrl-C, also stop the timer and persist duration
-            end_dt = datetime.now()
-            data = load_data()
-            if data and data[-1].get("end") is None:
-                data[-1]["end"] = end_dt.isoformat()
-                try:
-                    start_dt = datetime.fromisoformat(data[-1]["start"])
-                    secs = int((end_dt - start_dt).total_seconds())
-                    data[-1]["duration_seconds"] = secs
-                    data[-1]["duration"] = _secs_to_hms(secs)
-                except Exception:
-                    pass
-                save_data(data)
-                print("\nStopped (via Ctrl-C):", data[-1]["project"]) 
+            stopped = _stop_started_entry(datetime.now())
+            if stopped:
+                print("\nStopped (via Ctrl-C):", stopped["project"]) 
             return
 
 
 def cmd_stop(_: argparse.Namespace) -> None:
-    data = load_data()
-    if not data or data[-1].get("end") is not None:
+    active = load_last_entry()
+    if not active or active.get("end") is not None:
         print("No active timer.")
         return
-    end_iso = iso_now()
-    data[-1]["end"] = end_iso
-    # compute duration_seconds
-    try:
-        start_dt = datetime.fromisoformat(data[-1]["start"])
-        end_dt = datetime.fromisoformat(end_iso)
-        secs = int((end_dt - start_dt).total_seconds())
-        data[-1]["duration_seconds"] = secs
-        data[-1]["duration"] = _secs_to_hms(secs)
-    except Exception:
-        pass
-    save_data(data)
-    print(f"Stopped: {data[-1]['project']}")
+    _close_entry(active, datetime.now())
+    update_last_entry(active)
+    print(f"Stopped: {active['project']}")
 
 
 def cmd_add(args: argparse.Namespace) -> None:
@@ -356,10 +554,9 @@ def cmd_add(args: argparse.Namespace) -> None:
     # Create entry ending now, starting duration ago
     end_time = datetime.now()
     start_time = end_time - dur
-    data = load_data()
     secs = int(dur.total_seconds())
     
-    data.append({
+    append_entry({
         "project": project_name,
         "start": start_time.isoformat(),
         "end": end_time.isoformat(),
@@ -367,7 +564,6 @@ def cmd_add(args: argparse.Namespace) -> None:
         "duration": _secs_to_hms(secs),
         "manual": True,
     })
-    save_data(data)
     
     # Format output
     hours = secs // 3600
@@ -398,9 +594,8 @@ def cmd_log(args: argparse.Namespace) -> None:
         return
     end_time = datetime.now()
     start_time = end_time - dur
-    data = load_data()
     secs = int(dur.total_seconds())
-    data.append({
+    append_entry({
         "project": args.project,
         "start": start_time.isoformat(),
         "end": end_time.isoformat(),
@@ -408,17 +603,16 @@ def cmd_log(args: argparse.Namespace) -> None:
         "duration": _secs_to_hms(secs),
         "manual": True,
     })
-    save_data(data)
     mins = int(dur.total_seconds() // 60)
     print(f"Logged {mins}m to: {args.project}")
 
 
 def cmd_clear(_: argparse.Namespace) -> None:
-    # Delete the default home log and an optional local project log
+    # Delete the default home log (plus any pre-JSONL leftover) and an optional local project log
     home_target = DEFAULT_DATA_FILE
     local_target = os.path.abspath(os.path.join(os.getcwd(), "timelog.json"))
 
-    for target in (home_target, local_target):
+    for target in (home_target, LEGACY_DATA_FILE, local_target):
         try:
             if os.path.exists(target):
                 os.remove(target)
@@ -429,8 +623,9 @@ def cmd_clear(_: argparse.Namespace) -> None:
             print(f"Failed to delete {target}: {e}")
 
 
-def human_td(delta: timedelta) -> str:
-    total_seconds = int(delta.total_seconds())
+def human_td(delta: Union[timedelta, int]) -> str:
+    # Accepts a timedelta or a plain number of seconds
+    total_seconds = delta if isinstance(delta, int) else int(delta.total_seconds())
     neg = total_seconds < 0
     total_seconds = abs(total_seconds)
     h, rem = divmod(total_seconds, 3600)
@@ -454,18 +649,60 @@ def end_of_month(d: date) -> datetime:
     return next_month
 
 
-def day_span(dt: datetime) -> datetime:
-    # next midnight from dt
-    next_day = (dt + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-    return next_day
+US_PER_SECOND = 1_000_000
+US_PER_DAY = 86_400 * US_PER_SECOND
+
+
+def _wall_us(dt: datetime) -> int:
+    # Wall-clock time as integer microseconds since 0001-01-01 (time zone ignored);
+    # differences match naive datetime subtraction exactly
+    secs = dt.toordinal() * 86_400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+    return secs * US_PER_SECOND + dt.microsecond
+
+
+def _accumulate_day_totals(
+    intervals: List[Tuple[int, int, int]],
+    first: int,
+    day_starts: List[int],
+    out: List[List[int]],
+) -> None:
+    # Kernel of cmd_report: add each interval's overlap with day d, i.e.
+    # [day_starts[d], day_starts[d + 1]), into out[d][project_id].
+    # All times are integer microseconds from _wall_us().
+    # `intervals` is sorted by start; scanning begins at index `first` and stops
+    # at the first interval starting after the window.
+    lo, hi = day_starts[0], day_starts[-1]
+    for i in range(first, len(intervals)):
+        proj_id, start, end = intervals[i]
+        if start >= hi:
+            break
+        if start < lo:
+            start = lo
+        if end > hi:
+            end = hi
+        if end <= start:
+            continue
+        # day_starts are consecutive midnights, so the day index is a plain subtraction
+        d = (start - lo) // US_PER_DAY
+        while start < end:
+            seg_end = day_starts[d + 1]
+            if end < seg_end:
+                seg_end = end
+            out[d][proj_id] += seg_end - start
+            start = seg_end
+            d += 1
+
 
+def _csv_field(s: str) -> str:
+    # Same quoting as csv.writer's QUOTE_MINIMAL: only when the field needs it
+    if "," in s or '"' in s or "\n" in s or "\r" in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
 
-def clamp_interval(a: datetime, b: datetime, lo: datetime, hi: datetime) -> Optional[tuple]:
-    start = max(a, lo)
-    end = min(b, hi)
-    if end <= start:
-        return None
-    return (start, end)
+
+def _csv_text(rows: List[List[str]]) -> str:
+    # csv.writer's default "\r\n" line terminator, kept for spreadsheet compatibility
+    return "".join(",".join(_csv_field(f) for f in row) + "\r\n" for row in rows)
 
 
 def cmd_report(args: argparse.Namespace) -> None:
@@ -475,23 +712,53 @@ def cmd_report(args: argparse.Namespace) -> None:
         return
 
     now = datetime.now()
-    
-    # First pass: collect all months that have data
+
+    # Each unique ISO timestamp is parsed once per run and reused across months
+    parse_cache: Dict[str, datetime] = {}
+
+    def parse_iso(s: str) -> datetime:
+        dt = parse_cache.get(s)
+        if dt is None:
+            dt = parse_cache[s] = datetime.fromisoformat(s)
+        return dt
+
+    # First pass: parse every entry once into (project id, start, end) and collect
+    # all months that have data; the per-month passes below only reuse these.
+    # Projects are interned to small ints so aggregation indexes lists, not dicts.
+    proj_to_id: Dict[str, int] = {}
+    intervals: List[Tuple[int, int, int]] = []
     months_with_data = set()
     for e in data:
         start_s = e.get("start")
         end_s = e.get("end")
         if not start_s:
             continue
-        start = datetime.fromisoformat(start_s)
-        end = datetime.fromisoformat(end_s) if end_s else now
-        
+        start = parse_iso(start_s)
+        end = parse_iso(end_s) if end_s else now
+        proj_id = proj_to_id.setdefault(e.get("project", "(unknown)"), len(proj_to_id))
+        intervals.append((proj_id, _wall_us(start), _wall_us(end)))
+
         # Add months for both start and end dates
         months_with_data.add((start.year, start.month))
         months_with_data.add((end.year, end.month))
     
+    proj_names = list(proj_to_id)
+    # Display order (case-insensitive by name), decided once for the whole report;
+    # names differing only by case ("Alpha"/"alpha") tie-break on the exact name
+    # so the order doesn't depend on log order
+    sort_keys = [(name.lower(), name) for name in proj_names]
+    proj_order = sorted(range(len(proj_names)), key=sort_keys.__getitem__)
+
     # Sort months chronologically
     sorted_months = sorted(months_with_data)
+
+    # Order intervals by start (the log is append-only, so this is nearly free) and
+    # keep a running max of end times; each month then bisects to the first interval
+    # that can still reach into it and stops at the first one starting after it
+    intervals.sort(key=lambda iv: iv[1])
+    reach: List[int] = []
+    for _, _, end in intervals:
+        reach.append(end if not reach or end > reach[-1] else reach[-1])
     
     print(f"Generating reports for {len(sorted_months)} months with data...")
     print()
@@ -500,50 +767,41 @@ def cmd_report(args: argparse.Namespace) -> None:
     for year, month in sorted_months:
         month_start = datetime(year, month, 1)
         month_end = end_of_month(datetime(year, month, 1).date())  # exclusive upper bound
+        month_start_us = _wall_us(month_start)
         
-        # Aggregations for this specific month
-        # per_day_totals[YYYY-MM-DD][project] = timedelta
-        per_day_totals: Dict[str, Dict[str, timedelta]] = {}
-        monthly_project_totals: Dict[str, timedelta] = {}
-
-        for e in data:
-            proj = e.get("project", "(unknown)")
-            start_s = e.get("start")
-            end_s = e.get("end")
-            if not start_s:
-                continue
-            start = datetime.fromisoformat(start_s)
-            end = datetime.fromisoformat(end_s) if end_s else now
-
-            # Consider only overlap with this month window [month_start, month_end)
-            interval = clamp_interval(start, end, month_start, month_end)
-            if not interval:
-                continue
-            cur_start, cur_end = interval
-
-            # Split across days
-            while cur_start < cur_end:
-                next_midnight = day_span(cur_start)
-                seg_end = min(cur_end, next_midnight)
-                dur = seg_end - cur_start
-                day_key = cur_start.date().isoformat()
-                per_day_totals.setdefault(day_key, {})
-                per_day_totals[day_key][proj] = per_day_totals[day_key].get(proj, timedelta()) + dur
-                monthly_project_totals[proj] = monthly_project_totals.get(proj, timedelta()) + dur
-                cur_start = seg_end
-
-        # Skip months with no actual time logged
-        if not monthly_project_totals:
-            continue
-
-        # Prepare weekly grouping within the month
         # Build ordered list of days in the month
         days: List[date] = []
         dcur = month_start.date()
         while datetime.combine(dcur, datetime.min.time()) < month_end:
             days.append(dcur)
             dcur = dcur + timedelta(days=1)
+        day_starts = [month_start_us + i * US_PER_DAY for i in range(len(days) + 1)]
+
+        # Aggregations for this specific month, kept as exact integer microseconds
+        # and converted to whole seconds only for display
+        # totals[day index][project id] = microseconds
+        totals = [[0] * len(proj_names) for _ in days]
+        _accumulate_day_totals(intervals, bisect.bisect_right(reach, month_start_us), day_starts, totals)
+
+        # Back to project names for printing/export, walking ids in display order so
+        # each day's list comes out already sorted
+        # daily_rows: [(day, [(project, microseconds), ...]), ...] for days with time
+        daily_rows: List[Tuple[date, List[Tuple[str, int]]]] = []
+        month_sums = [0] * len(proj_names)
+        for dday, row in zip(days, totals):
+            projects = [(proj_names[p], row[p]) for p in proj_order if row[p]]
+            if not projects:
+                continue
+            daily_rows.append((dday, projects))
+            month_sums = [acc + dur for acc, dur in zip(month_sums, row)]
+        monthly_rows = [(proj_names[p], month_sums[p]) for p in proj_order if month_sums[p]]
 
+        # Skip months with no actual time logged
+        if not monthly_rows:
+            continue
+        per_day_totals = dict(daily_rows)
+
+        # Prepare weekly grouping within the month
         # Group by ISO week
         from collections import OrderedDict
 
@@ -555,10 +813,23 @@ def cmd_report(args: argparse.Namespace) -> None:
                 weeks[key] = []
             weeks[key].append(dday)
 
-        # Printing
+        # Microseconds -> "HH:MM" for the CSV duration column
+        def us_to_hm(us: int) -> str:
+            h, rem = divmod(us // US_PER_SECOND, 3600)
+            m, _ = divmod(rem, 60)
+            return f"{h:02d}:{m:02d}"
+
+        # Printing and CSV rows are produced in the same pass over the prepared rows
         month_label = month_start.strftime("%B %Y")
-        print(f"Report for {month_label} (from {month_start.strftime('%Y-%m-%d')} to {(month_end - timedelta(days=1)).strftime('%Y-%m-%d')})")
+        month_range = f"{month_start.strftime('%Y-%m-%d')} to {(month_end - timedelta(days=1)).strftime('%Y-%m-%d')}"
+        print(f"Report for {month_label} (from {month_range})")
         print("")
+        rows: List[List[str]] = [
+            [f"Report for {month_label}"],
+            [f"From {month_range}"],
+            [],
+            ["Date", "Weekday", "Project", "Duration (HH:MM)"],
+        ]
 
         # For each week, show days that have any time (or all days? keep concise: only days with data)
         for (wyear, wnum), wdays in weeks.items():
@@ -568,28 +839,30 @@ def cmd_report(args: argparse.Namespace) -> None:
             print(f"Week {wyear}-W{wnum:02d} ({label_start.strftime('%b %d')} - {label_end.strftime('%b %d')})")
             week_had_output = False
             for dday in wdays:
-                day_key = dday.isoformat()
-                if day_key not in per_day_totals:
+                projects = per_day_totals.get(dday)
+                if not projects:
                     continue
                 week_had_output = True
-                projects = per_day_totals[day_key]
-                day_total = sum((td for td in projects.values()), timedelta())
-                print(f"  {dday.strftime('%Y-%m-%d (%a)')}: {human_td(day_total)}")
-                for proj, dur in sorted(projects.items(), key=lambda x: x[0].lower()):
-                    print(f"    - {proj}: {human_td(dur)}")
+                day_total = sum(us for _, us in projects)
+                print(f"  {dday.strftime('%Y-%m-%d (%a)')}: {human_td(day_total // US_PER_SECOND)}")
+                day_label, weekday = dday.strftime('%Y-%m-%d'), dday.strftime('%a')
+                for proj, us in projects:
+                    print(f"    - {proj}: {human_td(us // US_PER_SECOND)}")
+                    rows.append([day_label, weekday, proj, us_to_hm(us)])
             if not week_had_output:
                 print("  (no time)")
             print("")
 
         # Monthly totals
         print("Monthly totals:")
-        if monthly_project_totals:
-            for proj, dur in sorted(monthly_project_totals.items(), key=lambda x: x[0].lower()):
-                print(f"- {proj}: {human_td(dur)}")
-            overall = sum((td for td in monthly_project_totals.values()), timedelta())
-            print(f"- Overall: {human_td(overall)}")
-        else:
-            print("(no time this month)")
+        rows.append([])
+        rows.append(["Monthly totals"])
+        for proj, us in monthly_rows:
+            print(f"- {proj}: {human_td(us // US_PER_SECOND)}")
+            rows.append([proj, us_to_hm(us)])
+        overall = sum(us for _, us in monthly_rows)
+        print(f"- Overall: {human_td(overall // US_PER_SECOND)}")
+        rows.append(["Overall", us_to_hm(overall)])
 
         # Export CSV to ~/Documents/Time Sheet Reports/<Month-YYYY>/<Time Sheet - <Month YYYY>>.csv
         # Build folder and filename
@@ -600,44 +873,9 @@ def cmd_report(args: argparse.Namespace) -> None:
         export_name = f"Time Sheet - {month_label}.csv"  # e.g., Time Sheet - August 2025.csv
         export_path = os.path.join(export_dir, export_name)
 
-        # Write CSV: Date, Weekday, Project, Duration (HH:MM)
-        def td_to_hm(td: timedelta) -> str:
-            total = int(td.total_seconds())
-            h, rem = divmod(total, 3600)
-            m, _ = divmod(rem, 60)
-            return f"{h:02d}:{m:02d}"
-
+        # Write CSV: Date, Weekday, Project, Duration (HH:MM), as a whole file in one write
         with open(export_path, "w", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([f"Report for {month_label}"])
-            writer.writerow([f"From {month_start.strftime('%Y-%m-%d')} to {(month_end - timedelta(days=1)).strftime('%Y-%m-%d')}"])
-            writer.writerow([])
-            writer.writerow(["Date", "Weekday", "Project", "Duration (HH:MM)"])
-
-            # Iterate days in order, writing only days with data
-            for dday in days:
-                day_key = dday.isoformat()
-                if day_key not in per_day_totals:
-                    continue
-                projects = per_day_totals[day_key]
-                for proj, dur in sorted(projects.items(), key=lambda x: x[0].lower()):
-                    writer.writerow([
-                        dday.strftime('%Y-%m-%d'),
-                        dday.strftime('%a'),
-                        proj,
-                        td_to_hm(dur),
-                    ])
-
-            # Monthly totals
-            writer.writerow([])
-            writer.writerow(["Monthly totals"])
-            if monthly_project_totals:
-                for proj, dur in sorted(monthly_project_totals.items(), key=lambda x: x[0].lower()):
-                    writer.writerow([proj, td_to_hm(dur)])
-                overall = sum((td for td in monthly_project_totals.values()), timedelta())
-                writer.writerow(["Overall", td_to_hm(overall)])
-            else:
-                writer.writerow(["(no time this month)"])
+            csvfile.write(_csv_text(rows))
 
         print("")
         try:
@@ -651,7 +889,11 @@ def cmd_report(args: argparse.Namespace) -> None:
         print("=" * 60)
         print()
     
-    print(f"Generated reports for {len([m for m in sorted_months if any(e.get('start') and datetime.fromisoformat(e['start']).year == m[0] and datetime.fromisoformat(e['start']).month == m[1] for e in data)])} months with time entries.")
+    # ISO 8601 strings sort/compare lexicographically, so the "YYYY-MM" prefix of each
+    # start identifies its month without parsing anything
+    start_months = {e["start"][:7] for e in data if e.get("start")}
+    months_with_entries = sum(1 for y, m in sorted_months if f"{y:04d}-{m:02d}" in start_months)
+    print(f"Generated reports for {months_with_entries} months with time entries.")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -682,7 +924,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_report = sp.add_parser("report", help="Show sessions and totals")
     p_report.set_defaults(func=cmd_report)
 
-    p_clear = sp.add_parser("clear", help="Delete ~/.timelog.json and ./timelog.json")
+    p_clear = sp.add_parser("clear", help="Delete ~/.timelog.jsonl, the legacy ~/.timelog.json and ./timelog.json")
     p_clear.set_defaults(func=cmd_clear)
 
     return parser